@@ -1,16 +1,29 @@
 import sys
+import os
 import re
+import tempfile
 import pymongo
+from pymongo import WriteConcern
 from pymongo.errors import ConnectionFailure, OperationFailure
 from faker import Faker
 import random
+import itertools
+import functools
+import queue
+import threading
 from PIL import Image, ImageDraw
 import io
 import base64
-import geopandas as gpd
-from shapely.geometry import Point
+import numpy as np
 import logging
 
+try:
+    # SIMD-accelerated base64 (AVX2/AVX-512 where the CPU supports it)
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data):
+        return base64.b64encode(data).decode('utf-8')
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -21,29 +34,92 @@ logger = logging.getLogger(__name__)
 # https://www.naturalearthdata.com/downloads/110m-cultural-vectors/
 # and unzip it to a directory named "geodata" or adjust the path accordingly.
 landmass_shapefile = "geodata/ne_110m_admin_0_countries.shp"
-landmasses = gpd.read_file(landmass_shapefile)
+
+@functools.lru_cache(maxsize=1)
+def _load_landmasses():
+    """Read the shapefile once, only when the land mask has to be built."""
+    import geopandas as gpd  # local import so cached runs skip geopandas/fiona
+    return gpd.read_file(landmass_shapefile)
+
+# Land/ocean raster of the shapefile at 1/30 degree resolution. It is built
+# once with rasterio and cached next to the shapefile, so later runs only
+# need np.load and a land test is a single array lookup.
+LAND_MASK_CELLS_PER_DEGREE = 30
+land_mask_file = os.path.splitext(landmass_shapefile)[0] + "_land_mask.npy"
+
+def build_land_mask():
+    """Rasterize the landmass polygons into a boolean (lat, lon) grid."""
+    from rasterio.features import rasterize  # only needed to (re)build the cache
+    from rasterio.transform import from_origin
+
+    cell_size = 1 / LAND_MASK_CELLS_PER_DEGREE
+    out_shape = (180 * LAND_MASK_CELLS_PER_DEGREE, 360 * LAND_MASK_CELLS_PER_DEGREE)
+    raster = rasterize(
+        ((geom, 1) for geom in _load_landmasses().geometry),
+        out_shape=out_shape,
+        transform=from_origin(-180, 90, cell_size, cell_size),
+        dtype="uint8",
+    )
+    return raster.astype(bool)
+
+@functools.lru_cache(maxsize=1)
+def load_land_mask():
+    """Load the cached land mask, building and saving it on first use."""
+    if os.path.exists(land_mask_file):
+        return np.load(land_mask_file, mmap_mode="r")
+    logger.info(f"Building land mask cache at {land_mask_file}")
+    mask = build_land_mask()
+    tmp_path = None
+    try:
+        # Write to a temp file and rename it into place, so an interrupted
+        # save never leaves a truncated cache behind
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".npy", dir=os.path.dirname(land_mask_file) or "."
+        )
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, mask)
+        os.replace(tmp_path, land_mask_file)
+    except OSError as e:
+        logger.warning(f"Could not save land mask cache to {land_mask_file}: {e}")
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return mask
 
 # ----------------------------------------------------------------------------
 # 2. User Prompts
 # ----------------------------------------------------------------------------
 
+def _read_line(prompt):
+    """Write 'prompt' and read one stripped line from stdin, like input()."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.strip()
+
+def _parse_int(text):
+    """Return 'text' as an int, or None if it isn't a whole number."""
+    body = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if body.isascii() and body.isdecimal() else None
+
 def get_num_fake_records():
     """
     Attempt to read an integer from command-line;
     if not present or invalid, prompts the user.
     """
     if len(sys.argv) > 1:
-        try:
-            return int(sys.argv[1])
-        except ValueError:
-            pass  # If invalid or missing, fall through to user input
+        num_records = _parse_int(sys.argv[1].strip())
+        if num_records is not None:
+            return num_records
+        # If invalid, fall through to user input
 
     while True:
-        val = input("Enter the number of fake records: ")
-        try:
-            return int(val)
-        except ValueError:
-            print("Invalid input. Please enter a whole number.")
+        num_records = _parse_int(_read_line("Enter the number of fake records: "))
+        if num_records is not None:
+            return num_records
+        print("Invalid input. Please enter a whole number.")
 
 def get_image_choice():
     """
@@ -58,7 +134,7 @@ def get_image_choice():
         print("1) Cat pictures")
         print("2) Random Pillow images")
         print("3) No images")
-        choice = input("Enter your choice (1/2/3): ")
+        choice = _read_line("Enter your choice (1/2/3): ")
         if choice in ["1", "2", "3"]:
             return int(choice)
         else:
@@ -68,9 +144,11 @@ def get_image_choice():
 # 3. MongoDB Connection and Password Redaction
 # ----------------------------------------------------------------------------
 
+PASSWORD_PATTERN = re.compile(r':[^@]+@')
+
 def redact_password(uri):
     """Redact any password in the URI by replacing it with *****."""
-    return re.sub(r':[^@]+@', ':*****@', uri)
+    return PASSWORD_PATTERN.sub(':*****@', uri)
 
 def connect_to_mongodb(uri, timeout_ms=100):
     """
@@ -139,61 +217,174 @@ def get_working_mongodb_client(uri_list):
 # ----------------------------------------------------------------------------
 
 fake = Faker()
+# Single NumPy generator for all batched random draws (coordinates, emails)
+sample_rng = np.random.default_rng()
+FAKER_POOL_SIZE = 4096
+faker_pool_size = FAKER_POOL_SIZE
+
+def set_faker_pool_size(num_records):
+    """
+    Size the Faker pools for a run of 'num_records' records, capped at
+    FAKER_POOL_SIZE, so small runs don't pay for values they never use.
+    Must be called before any values are drawn.
+    """
+    global faker_pool_size
+    faker_pool_size = max(1, min(FAKER_POOL_SIZE, num_records))
+    faker_pool.cache_clear()
+
+@functools.lru_cache(maxsize=None)
+def faker_pool(field, **kwargs):
+    """Generate faker_pool_size values of a Faker field once and cache them."""
+    provider = getattr(fake, field)
+    return [provider(**kwargs) for _ in range(faker_pool_size)]
+
+def fake_value(field, **kwargs):
+    """Pick a random pregenerated value of a Faker field, e.g. fake_value("city")."""
+    return random.choice(faker_pool(field, **kwargs))
+
+LAND_SAMPLE_BATCH_SIZE = 4096
+
+def land_coordinates(batch_size=LAND_SAMPLE_BATCH_SIZE):
+    """
+    Endlessly yield random (lon, lat) coordinates on land.
+    Candidates are drawn in NumPy batches and looked up all at once in
+    the rasterized land mask; only the points on land are yielded.
+    """
+    land_mask = load_land_mask()
+    rows, cols = land_mask.shape
+    while True:
+        lons = sample_rng.uniform(-180, 180, size=batch_size)
+        lats = sample_rng.uniform(-90, 90, size=batch_size)
+        ix = np.minimum(((lons + 180) * LAND_MASK_CELLS_PER_DEGREE).astype(int), cols - 1)
+        iy = np.minimum(((90 - lats) * LAND_MASK_CELLS_PER_DEGREE).astype(int), rows - 1)
+        mask = land_mask[iy, ix]
+        yield from zip(lons[mask].tolist(), lats[mask].tolist())
+
+_land_coordinates = land_coordinates()
 
 def generate_land_coordinates():
-    """Generate random coordinates on land by referencing shapefile polygons."""
+    """Generate random coordinates on land, as approximated by the 1/30 degree land mask."""
+    return next(_land_coordinates)
+
+EMAIL_PROVIDERS = [
+    'gmail.com', 'yahoo.com', 'outlook.com', 'example.com',
+    'test.com', 'hotmail.com'
+]
+EMAIL_BATCH_SIZE = 4096
+
+def varied_emails(batch_size=EMAIL_BATCH_SIZE):
+    """
+    Endlessly yield varied fake emails.
+    All the random choices for a batch (format, names, provider, number)
+    are drawn with one NumPy call each instead of per email.
+    """
+    first_names = faker_pool("first_name")
+    last_names = faker_pool("last_name")
     while True:
-        lon, lat = random.uniform(-180, 180), random.uniform(-90, 90)
-        point = Point(lon, lat)
-        # Check if this point is on land (any polygon of the shapefile)
-        if landmasses.contains(point).any():
-            return [lon, lat]
+        format_ids = sample_rng.integers(0, 4, size=batch_size).tolist()
+        first_ids = sample_rng.integers(0, len(first_names), size=batch_size).tolist()
+        last_ids = sample_rng.integers(0, len(last_names), size=batch_size).tolist()
+        provider_ids = sample_rng.integers(0, len(EMAIL_PROVIDERS), size=batch_size).tolist()
+        nums = sample_rng.integers(1, 101, size=batch_size).tolist()
+        for fmt, first_id, last_id, provider_id, num in zip(
+                format_ids, first_ids, last_ids, provider_ids, nums):
+            first, last = first_names[first_id], last_names[last_id]
+            provider = EMAIL_PROVIDERS[provider_id]
+            if fmt == 0:
+                yield f"{first}.{last}@{provider}"
+            elif fmt == 1:
+                yield f"{first}{num}@{provider}"
+            elif fmt == 2:
+                yield f"{last}{num}@{provider}"
+            else:
+                yield f"{first}{last}@{provider}"
+
+_varied_emails = varied_emails()
 
 def generate_varied_email():
     """Generate a varied fake email."""
-    email_providers = [
-        'gmail.com', 'yahoo.com', 'outlook.com', 'example.com',
-        'test.com', 'hotmail.com'
-    ]
-    email_formats = [
-        lambda: f"{fake.first_name()}.{fake.last_name()}@{random.choice(email_providers)}",
-        lambda: f"{fake.first_name()}{random.randint(1, 100)}@{random.choice(email_providers)}",
-        lambda: f"{fake.last_name()}{random.randint(1, 100)}@{random.choice(email_providers)}",
-        lambda: f"{fake.first_name()}{fake.last_name()}@{random.choice(email_providers)}",
-    ]
-    return random.choice(email_formats)()
+    return next(_varied_emails)
 
 # ----------------------------------------------------------------------------
 # 5. Conditional Image Logic
 # ----------------------------------------------------------------------------
 
-def create_cat_image():
+# Fast JPEG settings: 4:2:0 subsampling, no extra Huffman optimization pass
+JPEG_SAVE_OPTIONS = {"quality": 60, "subsampling": 2, "optimize": False, "progressive": False}
+
+# One reusable encode buffer per thread (cat images are encoded on worker threads)
+_jpeg_buffers = threading.local()
+
+def encode_jpeg_base64(image):
+    """JPEG-encode a Pillow image into this thread's buffer and return base64."""
+    buffered = getattr(_jpeg_buffers, "buffer", None)
+    if buffered is None:
+        buffered = _jpeg_buffers.buffer = io.BytesIO()
+    buffered.seek(0)
+    buffered.truncate(0)
+    image.save(buffered, format="JPEG", **JPEG_SAVE_OPTIONS)
+    return b64encode_as_string(buffered.getvalue())
+
+CAT_IMAGE_URLS = [
+    "https://cataas.com/cat/says/Hello",
+    "https://cataas.com/cat/gif",
+    "https://cataas.com/cat"
+]
+CAT_IMAGE_WORKERS = 16
+CAT_IMAGE_CONNECT_TIMEOUT = 5  # seconds
+CAT_IMAGE_READ_TIMEOUT = 15  # seconds
+
+def create_cat_image(http):
     """
     Downloads a cat image from a random URL, adds text, and returns base64.
+    'http' is a shared urllib3 PoolManager so connections are kept alive.
     Returns None if an error occurs.
     """
-    import requests
-    cat_image_urls = [
-        "https://cataas.com/cat/says/Hello",
-        "https://cataas.com/cat/gif",
-        "https://cataas.com/cat"
-    ]
     try:
-        random_cat_url = random.choice(cat_image_urls)
-        response = requests.get(random_cat_url, stream=True)
-        response.raise_for_status()
-        image = Image.open(response.raw).convert('RGB')
+        random_cat_url = random.choice(CAT_IMAGE_URLS)
+        response = http.request("GET", random_cat_url, preload_content=True)
+        if response.status >= 400:
+            raise IOError(f"HTTP {response.status} from {random_cat_url}")
+        image = Image.open(io.BytesIO(response.data)).convert('RGB')
         draw = ImageDraw.Draw(image)
         draw.text((10, 10), "Meow! I'm a cat!", fill=(255, 255, 255))
-        buffered = io.BytesIO()
-        image.save(buffered, format="JPEG")
-        return base64.b64encode(buffered.getvalue()).decode('utf-8')
+        return encode_jpeg_base64(image)
     except Exception as e:
         logger.warning(f"Failed to fetch cat image: {e}")
         return None
 
-def create_fake_image():
-    """Create a 100x100 random-colored Pillow image with text, in base64."""
+def cat_images(num_images, max_workers=CAT_IMAGE_WORKERS):
+    """
+    Yield 'num_images' base64 cat images, downloading them concurrently.
+    A bounded window of downloads is kept in flight so network round trips
+    overlap without buffering every image in memory.
+    """
+    import urllib3  # local import so we only load if we need it
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Timeouts make a stalled download fail into the None path instead of
+    # blocking the generator (and interpreter exit) forever
+    http = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=32,
+        retries=urllib3.Retry(3),
+        timeout=urllib3.Timeout(connect=CAT_IMAGE_CONNECT_TIMEOUT, read=CAT_IMAGE_READ_TIMEOUT),
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        submitted = min(num_images, max_workers * 2)
+        pending = deque(executor.submit(create_cat_image, http) for _ in range(submitted))
+        while pending:
+            image = pending.popleft().result()
+            if submitted < num_images:
+                pending.append(executor.submit(create_cat_image, http))
+                submitted += 1
+            yield image
+
+FAKE_IMAGE_POOL_SIZE = 256
+
+def render_fake_image():
+    """Render a 100x100 random-colored Pillow image with text, in base64."""
     image = Image.new('RGB', (100, 100), (
         random.randint(0, 255),
         random.randint(0, 255),
@@ -201,21 +392,31 @@ def create_fake_image():
     ))
     draw = ImageDraw.Draw(image)
     draw.text((10, 40), "Fake Image", fill=(255, 255, 255))
-    buffered = io.BytesIO()
-    image.save(buffered, format="JPEG")
-    return base64.b64encode(buffered.getvalue()).decode('utf-8')
+    return encode_jpeg_base64(image)
+
+@functools.lru_cache(maxsize=1)
+def fake_image_pool():
+    """Render the pool of fake images once, the first time one is needed."""
+    return [render_fake_image() for _ in range(FAKE_IMAGE_POOL_SIZE)]
 
-def get_image_function(image_choice):
+def create_fake_image():
+    """Pick a random-colored Pillow image from the prerendered pool."""
+    return random.choice(fake_image_pool())
+
+def get_image_function(image_choice, num_images):
     """
     Return a function that generates the appropriate image or None.
-      - If image_choice == 1 => cat image
+      - If image_choice == 1 => cat image (prefetched, 'num_images' in total)
       - If image_choice == 2 => fake Pillow image
       - If image_choice == 3 => no images
-    This ensures we never import requests or define cat_image_urls
+    This ensures we never import urllib3 or start download threads
     if the user doesn't need cat images.
     """
     if image_choice == 1:
-        return create_cat_image
+        images = cat_images(num_images)
+        def next_cat_image():
+            return next(images, None)
+        return next_cat_image
     elif image_choice == 2:
         return create_fake_image
     else:
@@ -228,6 +429,12 @@ def get_image_function(image_choice):
 # 6. MongoDB Database Operations
 # ----------------------------------------------------------------------------
 
+INSERT_BATCH_SIZE = 1000
+INSERT_QUEUE_SIZE = 4  # batches generated ahead of the insert thread
+
+# GeoJSON Point subdocument; each record gets a shallow copy with its own coordinates
+LOCATION_TEMPLATE = {"type": "Point", "coordinates": None}
+
 def perform_db_operations(client, database_name, num_records, image_generator):
     if client is None:
         logger.error(f"Skipping operations for database {database_name} due to connection issues.")
@@ -235,45 +442,78 @@ def perform_db_operations(client, database_name, num_records, image_generator):
 
     try:
         database = client[database_name]
-        collection = database["registrations"]
+        # Acknowledged but unjournaled writes: this is throwaway sample data
+        collection = database.get_collection(
+            "registrations", write_concern=WriteConcern(w=1, j=False)
+        )
 
         def database_size():
             stats = database.command("dbStats")
             return stats["storageSize"] / 1024 / 1024  # MB
 
         def count_records():
-            return collection.count_documents({})
+            # Reads collection metadata instead of scanning every document
+            return collection.estimated_document_count()
         
         def generate_fake_data(num_records):
-            data = []
             for _ in range(num_records):
+                location = LOCATION_TEMPLATE.copy()
+                location["coordinates"] = generate_land_coordinates()
                 record = {
-                    "name": fake.name(),
-                    "age": fake.random_int(min=18, max=60),
-                    "city": fake.city(),
+                    "name": fake_value("name"),
+                    "age": random.randint(18, 60),
+                    "city": fake_value("city"),
                     "email": generate_varied_email(),
-                    "notes": fake.text(max_nb_chars=200),
-                    "location": {
-                        "type": "Point",
-                        "coordinates": generate_land_coordinates()
-                    },
+                    "notes": fake_value("text", max_nb_chars=200),
+                    "location": location,
                     # If the image generator returns None, we'll store None
                     "image": image_generator()
                 }
-                data.append(record)
-            return data
+                yield record
         
+        set_faker_pool_size(num_records)
+
         records_before = count_records()
         size_before = database_size()
         logger.info(f"Total records before insert: {records_before}")
         logger.info(f"Database size before insert: {size_before:.2f} MB")
 
-        data_list = generate_fake_data(num_records)
-        collection.insert_many(data_list)
-
-        records_after = count_records()
+        # Stream records into fixed-size, unordered batches so only a few
+        # batches (and their images) are held in memory, and the server can
+        # apply each batch in parallel without a single bad document stopping
+        # it. Batches are inserted from a worker thread so generation and
+        # network I/O overlap; a None batch tells the worker to stop.
+        batches = queue.Queue(maxsize=INSERT_QUEUE_SIZE)
+        insert_state = {"inserted": 0, "error": None}
+
+        def insert_batches():
+            while (batch := batches.get()) is not None:
+                if insert_state["error"] is not None:
+                    continue  # keep draining so the producer never blocks
+                try:
+                    result = collection.insert_many(batch, ordered=False)
+                    insert_state["inserted"] += len(result.inserted_ids)
+                except Exception as e:
+                    insert_state["error"] = e
+
+        inserter = threading.Thread(target=insert_batches, daemon=True)
+        inserter.start()
+        try:
+            records = generate_fake_data(num_records)
+            while batch := list(itertools.islice(records, INSERT_BATCH_SIZE)):
+                if insert_state["error"] is not None:
+                    break
+                batches.put(batch)
+        finally:
+            batches.put(None)
+            inserter.join()
+        if insert_state["error"] is not None:
+            raise insert_state["error"]
+        records_inserted = insert_state["inserted"]
+
+        records_after = records_before + records_inserted
         size_after = database_size()
-        logger.info(f"Total records inserted: {num_records}")
+        logger.info(f"Total records inserted: {records_inserted}")
         logger.info(f"Total records after insert: {records_after}")
         logger.info(f"Database size after insert: {size_after:.2f} MB")
 
@@ -294,7 +534,7 @@ def main():
     image_choice = get_image_choice()
 
     # 3) Prepare the function that generates images (or None)
-    image_generator = get_image_function(image_choice)
+    image_generator = get_image_function(image_choice, num_records)
 
     # 4) Attempt to get a working MongoDB client
     mongodb_uris = [